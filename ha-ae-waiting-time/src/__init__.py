@@ -1,8 +1,12 @@
 import lvgl as lv
 import clocktime
-import ujson
 import net
 import urequests
+import gc
+import time
+import _thread
+import struct
+from array import array
 
 # ---------- App Name ----------
 NAME = "A&E Waiting Time"
@@ -11,7 +15,20 @@ NAME = "A&E Waiting Time"
 CAN_BE_AUTO_SWITCHED: bool = True
 DEBUG: bool = False
 API_URL: str = "https://www.ha.org.hk/opendata/aed/aedwtdata-tc.json"
-FETCH_INTERVAL_IN_SECONDS: int = 300
+FETCH_INTERVAL_IN_SECONDS: int = 300  # Used when the updateTime of the feed is unknown
+PUBLISH_INTERVAL_IN_SECONDS: int = 900  # Initial guess of how often the feed is published
+MIN_PUBLISH_INTERVAL_IN_SECONDS: int = 300
+MAX_PUBLISH_INTERVAL_IN_SECONDS: int = 3600
+POLL_GRACE_IN_SECONDS: int = 15  # Poll this long after a publication is expected
+OFFSET_PROBE_IN_SECONDS: int = 30  # Doubled while publications are caught on first try, to poll earlier
+LATE_RETRY_IN_SECONDS: int = 30  # Doubled up to FETCH_INTERVAL_IN_SECONDS while a publication is late
+FAILURE_RETRY_IN_SECONDS: int = 30  # Doubled up to MAX_FAILURE_RETRY_IN_SECONDS while fetches fail
+MAX_FAILURE_RETRY_IN_SECONDS: int = 900
+SNAPSHOT_PATH: str = "./apps/ha-ae-waiting-time/snapshot.txt"
+HISTORY_PATH: str = "./apps/ha-ae-waiting-time/history.bin"
+HISTORY_BUCKET_IN_MINUTES: int = 15  # One sample per hospital and bucket
+HISTORY_LENGTH: int = 32  # Buckets kept per hospital, i.e. bytes per hospital
+MAX_HISTORY_HOSPITALS: int = 32
 
 # ---------- App Icon ----------
 ICON: str = "A:apps/ha-ae-waiting-time/resources/icon.png"
@@ -25,21 +42,95 @@ MESSAGE_TYPE: dict[str, int] = {
     "ERROR": 3,
 }
 
+WAIT_UNIT_IN_MINUTES: int = 5  # Resolution of waiting time in the history
+NO_SAMPLE: int = 255
+SPARKLINE_WIDTH: int = HISTORY_LENGTH
+SPARKLINE_HEIGHT: int = 20
+SPARKLINE_MIN_SCALE_IN_MINUTES: int = 120  # Smaller waits do not fill the height of the sparkline
+
+VIEW_FEED: str = "feed"
+VIEW_SHORTEST: str = "shortest"
+VIEW_FAVOURITES: str = "favourites"
+VIEW_DISTRICT: str = "district"
+VIEWS: list = [  # (title, view) in the order they are switched through
+    ("Feed order", VIEW_FEED),
+    ("Shortest wait", VIEW_SHORTEST),
+    ("Favourites", VIEW_FAVOURITES),
+    ("By district", VIEW_DISTRICT),
+]
+VIEW_TITLE_DURATION_IN_MS: int = 2000  # How long the title of a view is shown after switching
+
+# Districts from Hong Kong Island over Kowloon to the New Territories and Islands
+DISTRICTS: list = [
+    ("Southern", ["瑪麗醫院"]),
+    ("Wan Chai", ["律敦治醫院"]),
+    ("Eastern", ["東區尤德夫人那打素醫院"]),
+    ("Yau Tsim Mong", ["伊利沙伯醫院", "廣華醫院"]),
+    ("Sham Shui Po", ["明愛醫院"]),
+    ("Kwun Tong", ["基督教聯合醫院"]),
+    ("Sai Kung", ["將軍澳醫院"]),
+    ("Sha Tin", ["威爾斯親王醫院"]),
+    ("Tai Po", ["雅麗氏何妙齡那打素醫院"]),
+    ("North", ["北區醫院"]),
+    ("Tsuen Wan", ["仁濟醫院"]),
+    ("Kwai Tsing", ["瑪嘉烈醫院"]),
+    ("Tuen Mun", ["屯門醫院"]),
+    ("Yuen Long", ["博愛醫院", "天水圍醫院"]),
+    ("Islands", ["北大嶼山醫院", "長洲醫院", "聖約翰醫院"]),
+]
+DISTRICT_INDEX: dict = {
+    hospital_name: index
+    for index, (_, hospital_names) in enumerate(DISTRICTS)
+    for hospital_name in hospital_names
+}
+
 # ---------- LVGL Widget ----------
 font_chinese = lv.binfont_create("A:apps/ha-ae-waiting-time/fonts/NotoSansTC_20_bpp2.bin")
 
 # Main screen
 main_scr = None
 list_container = None
-time_label_map = None
+status_label = None
+hospital_rows = None  # HospitalRow by hospName
+hospital_order = None  # hospNames in the order of the rows in the list
 
 # Message screen
 message_scr = None
 
 # ---------- State ----------
+app_mgr = None
 last_api_call_time = 0
 hospital_count = 0
 previous_focus_index = -1
+data_fetched_time = None
+last_status_text = None
+wait_history = None
+feed_wait_times = None  # Latest (hospName, topWait) tuples in feed order
+view_orders = None  # (wait_times, visible_count) by view, computed once per refresh
+current_view = VIEW_FEED
+view_title_until = None  # time.ticks_ms() until the title of the current view is shown
+
+# Background refresh. The worker thread fetches and parses the feed, and hands
+# the results over to the foreground through a queue guarded by a lock.
+WORKER_POLL_INTERVAL_IN_MS: int = 100
+refresh_lock = _thread.allocate_lock()
+refresh_results = []
+refresh_requested = False
+refreshing = False
+worker_alive = False
+worker_stop = False
+
+# Fetch schedule, predicting the next publication of the feed from its updateTime.
+# All times are in seconds of clocktime.now(), except feed_update_epoch which is
+# in the local time of the feed.
+next_fetch_time = 0
+feed_update_epoch = None  # updateTime of the latest data
+publish_interval = PUBLISH_INTERVAL_IN_SECONDS
+publish_offset = None  # Expected time between an updateTime and the feed being published
+offset_probe = OFFSET_PROBE_IN_SECONDS  # 0 once a publication was missed, i.e. the offset is known
+last_fetch_time = None
+late_count = 0
+failure_count = 0
 
 # ---------- Styles ----------
 def reset_style(style_object):
@@ -79,6 +170,22 @@ focused_item_style = lv.style_t()
 focused_item_style.init()
 focused_item_style.set_bg_color(lv.color_hex(0xf0f0f0))
 
+# Sparkline style
+sparkline_style = lv.style_t()
+sparkline_style.init()
+sparkline_style.set_line_width(2)
+sparkline_style.set_line_color(lv.color_hex(0x999999))
+sparkline_style.set_line_rounded(True)
+
+# JSON escape sequences other than \uXXXX
+ESCAPED_CHARACTERS: dict[int, bytes] = {
+    0x62: b"\b",
+    0x66: b"\f",
+    0x6E: b"\n",
+    0x72: b"\r",
+    0x74: b"\t",
+}
+
 # ---------- Functions ----------
 def dprint(msg: str) -> None:
     """
@@ -90,30 +197,162 @@ def dprint(msg: str) -> None:
     if DEBUG:
         print(msg)
 
-def request(url: str):
+def request(url: str, validators: dict = None):
     """
-    Load JSON response from a given URL.
+    Request a given URL without reading the response body yet.
 
     Args:
         url (str): The URL to load
+        validators (dict): Optional If-None-Match / If-Modified-Since headers of a conditional request
     Returns:
-        JSON object.
+        Response, to read the body from `response.raw`, or with status code 304 if
+        the validators still match. The caller must close it.
 
     Raises:
         Exception, if something went wrong loading the API.
     """
     if net.connected():
         dprint(f"Fetching {url}")
-        response = urequests.get(url, headers={"Content-Type": "application/json"})
+        headers = {"Content-Type": "application/json"}
+        if validators:
+            headers.update(validators)
+        response = urequests.get(url, headers=headers)
 
-        if response.status_code == 200:
+        if response.status_code == 200 or response.status_code == 304:
             dprint(f"Got response with status code {response.status_code}")
-            return ujson.loads(response.text)
+            return response
         else:
-            raise Exception(f"Failed to load {url}, status code: {response.status_code}, response body: {response.text}")
+            try:
+                raise Exception(f"Failed to load {url}, status code: {response.status_code}, response body: {response.text}")
+            finally:
+                response.close()
     else:
         raise Exception(f"Wifi is not connected")
 
+class WaitTimeParser:
+    """
+    Incremental parser for the A&E waiting time feed, which looks like
+    {"waitTime": [{"hospName": "...", "topWait": "..."}, ...], "updateTime": "..."}.
+
+    The body is read from the socket in small chunks and only the strings of
+    interest are decoded, so neither the whole body nor the whole JSON tree is
+    ever held in memory.
+    """
+    CHUNK_SIZE = 256
+    MAX_STRING_SIZE = 256
+    ENTRY_DEPTH = 3  # Open containers inside an element of waitTime: {"waitTime": [{...
+
+    def __init__(self, stream) -> None:
+        """
+        Args:
+            stream: The stream to read the JSON body from
+        """
+        self.stream = stream
+        self.update_time = None
+        self.byte_count = 0
+        self.peak_alloc = gc.mem_alloc()
+
+    def __iter__(self):
+        """
+        Yields:
+            (hospName, topWait) tuples in feed order.
+
+        Raises:
+            Exception, if the feed is malformed.
+        """
+        chunk = bytearray(self.CHUNK_SIZE)
+        string = bytearray(self.MAX_STRING_SIZE)
+        string_length = 0
+        in_string = False
+        escape = False
+        unicode_digits = None
+
+        containers = []  # Open "{" and "[" characters
+        expect_key = False
+        key = None
+        hospital_name = None
+        top_wait = None
+
+        while True:
+            count = self.stream.readinto(chunk)
+            if not count:
+                break
+            self.byte_count += count
+            alloc = gc.mem_alloc()
+            if alloc > self.peak_alloc:
+                self.peak_alloc = alloc
+
+            for i in range(count):
+                byte = chunk[i]
+
+                if in_string:
+                    if unicode_digits is not None:
+                        unicode_digits.append(byte)
+                        if len(unicode_digits) < 4:
+                            continue
+                        encoded = chr(int(bytes(unicode_digits), 16)).encode()
+                        unicode_digits = None
+                    elif escape:
+                        escape = False
+                        if byte == 0x75:  # \uXXXX
+                            unicode_digits = bytearray()
+                            continue
+                        encoded = ESCAPED_CHARACTERS.get(byte, bytes((byte,)))
+                    elif byte == 0x5C:  # Backslash
+                        escape = True
+                        continue
+                    elif byte == 0x22:  # End of string
+                        in_string = False
+                        value = bytes(string[:string_length]).decode()
+                        if expect_key:
+                            key = value
+                        elif key == "hospName" and len(containers) == self.ENTRY_DEPTH:
+                            hospital_name = value
+                        elif key == "topWait" and len(containers) == self.ENTRY_DEPTH:
+                            top_wait = value
+                        elif key == "updateTime" and len(containers) == 1:
+                            self.update_time = value
+                        continue
+                    else:
+                        if string_length < self.MAX_STRING_SIZE:
+                            string[string_length] = byte
+                            string_length += 1
+                        continue
+
+                    for encoded_byte in encoded:
+                        if string_length < self.MAX_STRING_SIZE:
+                            string[string_length] = encoded_byte
+                            string_length += 1
+                elif byte == 0x22:  # Start of string
+                    in_string = True
+                    string_length = 0
+                elif byte == 0x7B:  # {
+                    containers.append(byte)
+                    expect_key = True
+                    if len(containers) == self.ENTRY_DEPTH:
+                        hospital_name = None
+                        top_wait = None
+                elif byte == 0x5B:  # [
+                    containers.append(byte)
+                    expect_key = False
+                elif byte == 0x7D or byte == 0x5D:  # } or ]
+                    if not containers:
+                        raise Exception("Malformed waiting time feed")
+                    # Nested objects inside an element do not end it
+                    if byte == 0x7D and len(containers) == self.ENTRY_DEPTH and hospital_name is not None and top_wait is not None:
+                        yield hospital_name, top_wait
+                        hospital_name = None
+                        top_wait = None
+                    containers.pop()
+                    expect_key = False
+                elif byte == 0x3A:  # :
+                    expect_key = False
+                elif byte == 0x2C:  # ,
+                    expect_key = bool(containers) and containers[-1] == 0x7B
+
+        if containers or in_string:
+            raise Exception("Waiting time feed truncated")
+
 def make_display_fullscreen_message(level: str = MESSAGE_TYPE["INFO"]) -> function[str]:
     """
     Creates function that display fullscreen message
@@ -166,15 +405,88 @@ def event_handler(event) -> None:
 
     # dprint(f"Got code {e_code}")
 
-    if hospital_count > 0 and e_code == lv.EVENT.KEY:
+    if e_code == lv.EVENT.KEY:
         e_key = event.get_key()
         dprint(f"Got key {e_key}")
 
-        if e_key == lv.KEY.LEFT:
+        if e_key == lv.KEY.ENTER:
+            switch_view()
+        elif hospital_count > 0 and e_key == lv.KEY.LEFT:
             focus_item((previous_focus_index + 1) % hospital_count)
-        elif e_key == lv.KEY.RIGHT:
+        elif hospital_count > 0 and e_key == lv.KEY.RIGHT:
             focus_item((previous_focus_index - 1) % hospital_count)
 
+def switch_view() -> None:
+    """
+    Switch to the next view, skipping favourites if none are configured. The
+    rows are only reordered, shown or hidden, as all views were computed on refresh.
+    """
+    global current_view, view_title_until
+
+    views = [view for _, view in VIEWS if view != VIEW_FAVOURITES or get_favourites()]
+    current_view = views[(views.index(current_view) + 1) % len(views)] if current_view in views else views[0]
+    dprint(f"Switch to view {current_view}")
+
+    if view_orders is not None:
+        wait_times, visible_count = view_orders[current_view]
+        render_wait_times(wait_times, None, visible_count)
+        if previous_focus_index != -1:
+            list_container.get_child(previous_focus_index).scroll_to_view(lv.ANIM.OFF)
+        else:
+            list_container.scroll_to_y(0, lv.ANIM.OFF)
+
+    view_title_until = time.ticks_add(time.ticks_ms(), VIEW_TITLE_DURATION_IN_MS)
+    update_status_label()
+
+def get_favourites() -> list:
+    """
+    Returns:
+        List of the configured favourites, each a part of a hospital name.
+    """
+    app_mgr_config = app_mgr.config() if app_mgr else {}
+    favourites = app_mgr_config.get("favourites", "").replace("，", ",")
+    return [favourite.strip() for favourite in favourites.split(",") if favourite.strip()]
+
+def compute_view_orders(wait_times: list) -> dict:
+    """
+    Compute the order of hospitals of every view, so switching views does not
+    need to sort again.
+
+    Args:
+        wait_times (list): List of (hospName, topWait) tuples in feed order
+
+    Returns:
+        Dict of (list of (hospName, topWait) tuples, number of visible rows) by
+        view. Hospitals which are not visible in a view are at the end of its list.
+    """
+    unique = []
+    seen = set()
+    for hospital_name, top_wait in wait_times:
+        if hospital_name not in seen:
+            seen.add(hospital_name)
+            unique.append((hospital_name, top_wait))
+    count = len(unique)
+
+    # Unknown waiting time and districts go last, ties keep the feed order
+    wait_keys = []
+    for index, (_, top_wait) in enumerate(unique):
+        minutes = parse_wait_minutes(top_wait)
+        wait_keys.append((minutes is None, minutes or 0, index))
+
+    shortest = sorted(range(count), key=lambda index: wait_keys[index])
+    district = sorted(range(count), key=lambda index: (DISTRICT_INDEX.get(unique[index][0], len(DISTRICTS)), index))
+
+    favourites = get_favourites()
+    is_favourite = [any(favourite in hospital_name for favourite in favourites) for hospital_name, _ in unique]
+    favourite_first = [index for index in range(count) if is_favourite[index]] + [index for index in range(count) if not is_favourite[index]]
+
+    return {
+        VIEW_FEED: (unique, count),
+        VIEW_SHORTEST: ([unique[index] for index in shortest], count),
+        VIEW_FAVOURITES: ([unique[index] for index in favourite_first], sum(is_favourite) if favourites else count),
+        VIEW_DISTRICT: ([unique[index] for index in district], count),
+    }
+
 def focus_item(index: int) -> None:
     """
     Focus list item of given index
@@ -199,95 +511,721 @@ def focus_item(index: int) -> None:
 
     previous_focus_index = index
 
-def fetch_and_display_wait_time() -> None:
+def create_main_screen() -> None:
+    """
+    Create the main screen with the header and the (empty) list of hospitals
+
+    Returns:
+        None. The main screen is created, but not loaded.
+    """
+    global main_scr, list_container, status_label
+
+    main_scr = lv.obj()
+
+    # Add header
+    header = lv.label(main_scr)
+    header.set_text("急症室等候時間")
+    header.align(lv.ALIGN.TOP_LEFT, 0, 0)
+    header.set_style_text_align(lv.TEXT_ALIGN.CENTER, 0)
+    header.add_style(header_style, 0)
+    header.update_layout()
+
+    # Add refreshing indicator and age of data
+    status_label = lv.label(main_scr)
+    status_label.set_style_text_font(lv.font_ascii_14, 0)
+    status_label.set_style_text_color(lv.color_hex(0xFFFFFF), 0)
+    status_label.set_text("")
+    status_label.align(lv.ALIGN.TOP_RIGHT, -8, (header.get_height() - 14) // 2)
+
+    container_height = SCREEN_HEIGHT - header.get_height()
+
+    # Add list container
+    list_container = lv.list(main_scr)
+    list_container.set_size(SCREEN_WIDTH, container_height)
+    list_container.align(lv.ALIGN.TOP_LEFT, 0, header.get_height())
+    list_container.set_scrollbar_mode(lv.SCROLLBAR_MODE.AUTO)
+    list_container.add_style(list_style, 0)
+
+    # Bind input events
+    main_scr.add_event(event_handler, lv.EVENT.ALL, None)
+    lv.group_get_default().add_obj(main_scr)
+    lv.group_focus_obj(main_scr)
+    lv.group_get_default().set_editing(True)
+
+def parse_wait_minutes(top_wait: str):
+    """
+    Parse a topWait of the feed, e.g. "超過2小時" or "少於1小時".
+
+    Args:
+        top_wait (str): The topWait of the feed
+
+    Returns:
+        Estimated waiting time in minutes, or None if it cannot be parsed. "Over N
+        hours" and "less than N hours" are taken as half an hour more or less than N hours.
+    """
+    digits = "".join(character for character in top_wait if "0" <= character <= "9")
+    if not digits:
+        return None
+    value = int(digits)
+    if "分" in top_wait:
+        return value
+    if "少於" in top_wait:
+        return max(value * 60 - 30, 0)
+    return value * 60 + 30
+
+class WaitHistory:
+    """
+    Rolling history of waiting time per hospital. Each hospital has a ring
+    buffer of HISTORY_LENGTH bytes, one per bucket of HISTORY_BUCKET_IN_MINUTES,
+    holding the waiting time in WAIT_UNIT_IN_MINUTES or NO_SAMPLE. All buffers
+    share the same latest bucket, so at most MAX_HISTORY_HOSPITALS * HISTORY_LENGTH
+    bytes are used.
+    """
+    def __init__(self) -> None:
+        self.buffers = {}  # array("B") by hospName
+        self.latest_bucket = None
+
+    def record(self, wait_times: list, fetched_time: int) -> None:
+        """
+        Record waiting times into the bucket of the given time. Hospitals which
+        are no longer in the feed are dropped.
+
+        Args:
+            wait_times (list): List of (hospName, topWait) tuples
+            fetched_time (int): When the data was fetched, as returned by clocktime.now()
+        """
+        bucket = fetched_time // (HISTORY_BUCKET_IN_MINUTES * 60)
+        if self.latest_bucket is not None and bucket > self.latest_bucket:
+            # Clear the buckets skipped since the latest sample
+            for skipped in range(self.latest_bucket + 1, min(bucket, self.latest_bucket + HISTORY_LENGTH) + 1):
+                for buffer in self.buffers.values():
+                    buffer[skipped % HISTORY_LENGTH] = NO_SAMPLE
+        if self.latest_bucket is None or bucket > self.latest_bucket:
+            self.latest_bucket = bucket
+        # If the clock went back, the latest bucket is overwritten
+
+        buffers = {}
+        for hospital_name, top_wait in wait_times:
+            buffer = self.buffers.get(hospital_name)
+            if buffer is None:
+                if len(buffers) >= MAX_HISTORY_HOSPITALS:
+                    continue
+                buffer = array("B", [NO_SAMPLE] * HISTORY_LENGTH)
+            minutes = parse_wait_minutes(top_wait)
+            buffer[self.latest_bucket % HISTORY_LENGTH] = NO_SAMPLE if minutes is None else min(minutes // WAIT_UNIT_IN_MINUTES, NO_SAMPLE - 1)
+            buffers[hospital_name] = buffer
+        self.buffers = buffers
+
+    def samples(self) -> dict:
+        """
+        Returns:
+            Dict of bytes by hospName, with the samples from oldest to latest bucket.
+        """
+        if self.latest_bucket is None:
+            return {}
+        head = self.latest_bucket % HISTORY_LENGTH + 1
+        return {hospital_name: bytes(buffer[head:]) + bytes(buffer[:head]) for hospital_name, buffer in self.buffers.items()}
+
+    def save(self) -> None:
+        """
+        Store the history on flash: the latest bucket, the number of buckets and
+        hospitals, and for each hospital the length of its name, its name and buffer.
+        """
+        if self.latest_bucket is None:
+            return
+        try:
+            with open(HISTORY_PATH, "wb") as file:
+                file.write(struct.pack("<iBB", self.latest_bucket, HISTORY_LENGTH, len(self.buffers)))
+                for hospital_name, buffer in self.buffers.items():
+                    name = hospital_name.encode()[:255]
+                    file.write(bytes((len(name),)))
+                    file.write(name)
+                    file.write(buffer)
+        except OSError as e:
+            dprint(f"Failed to save history: {e}")
+
+    def load(self) -> None:
+        """
+        Load the history stored on flash, if it has the same number of buckets.
+        """
+        try:
+            with open(HISTORY_PATH, "rb") as file:
+                latest_bucket, length, count = struct.unpack("<iBB", file.read(6))
+                if length != HISTORY_LENGTH:
+                    return
+                buffers = {}
+                for _ in range(min(count, MAX_HISTORY_HOSPITALS)):
+                    name = file.read(file.read(1)[0])
+                    buffer = array("B", file.read(HISTORY_LENGTH))
+                    if len(buffer) != HISTORY_LENGTH:
+                        raise ValueError("History truncated")
+                    buffers[name.decode()] = buffer
+            self.buffers = buffers
+            self.latest_bucket = latest_bucket
+        except (OSError, ValueError, IndexError) as e:
+            dprint(f"No history loaded: {e}")
+
+def fetch_wait_time(validators: dict) -> tuple:
+    """
+    Fetch and parse latest waiting time. Runs in the background worker.
+
+    Args:
+        validators (dict): Headers of a conditional request, as returned by the previous call
+
+    Returns:
+        Tuple of list of (hospName, topWait) tuples, the updateTime of the feed and
+        the validators for the next call. The list and updateTime are None if the
+        feed was not modified.
+
+    Raises:
+        Exception, if something went wrong loading the API.
+    """
+    alloc_before = gc.mem_alloc()
+    response = request(API_URL, validators)
+
+    try:
+        if response.status_code == 304:
+            dprint("Feed not modified")
+            return None, None, validators
+
+        new_validators = get_validators(response)
+        parser = WaitTimeParser(response.raw)
+        wait_times = list(parser)
+    finally:
+        response.close()
+
+    dprint(
+        f"Got {len(wait_times)} hospitals in {parser.byte_count} bytes. "
+        f"Heap: {alloc_before} bytes allocated before, peak {parser.peak_alloc} bytes while parsing, {gc.mem_alloc()} bytes after"
+    )
+    return wait_times, parser.update_time, new_validators
+
+def get_validators(response) -> dict:
+    """
+    Build the headers of a conditional request from the ETag and Last-Modified
+    headers of a response.
+
+    Args:
+        response: The response to read the headers from
+
+    Returns:
+        Dict of If-None-Match / If-Modified-Since headers, empty if the server sent no validators.
+    """
+    validators = {}
+    for name, value in (getattr(response, "headers", None) or {}).items():
+        name = name.lower()
+        if name == "etag":
+            validators["If-None-Match"] = value
+        elif name == "last-modified":
+            validators["If-Modified-Since"] = value
+    return validators
+
+def parse_update_time(update_time: str):
+    """
+    Parse the updateTime of the feed, e.g. "16/10/2026 9:15pm".
+
+    Args:
+        update_time (str): The updateTime of the feed
+
+    Returns:
+        Seconds since epoch in the local time of the feed, or None if it cannot be parsed.
+    """
+    try:
+        date, clock = update_time.strip().split(" ")
+        day, month, year = date.split("/")
+        meridiem = clock[-2:].lower()
+        hour, minute = clock[:-2].split(":")
+        hour = int(hour) % 12
+        if meridiem == "pm":
+            hour += 12
+        elif meridiem != "am":
+            return None
+        return time.mktime((int(year), int(month), int(day), hour, int(minute), 0, 0, 0))
+    except (AttributeError, ValueError, OverflowError):
+        return None
+
+def schedule_next_fetch(succeeded: bool, update_time, fetched_time: int) -> None:
+    """
+    Decide when to fetch next. The feed only changes when it is published, so
+    the next fetch is scheduled shortly after the next publication, predicted
+    from the updateTime and the learnt publish interval. If the publication is
+    late or fetching failed, it is retried with an increasing delay.
+
+    Args:
+        succeeded (bool): Whether the fetch succeeded
+        update_time (str): The updateTime of the fetched feed, None if not modified or failed
+        fetched_time (int): When the fetch finished, as returned by clocktime.now()
+    """
+    global next_fetch_time, feed_update_epoch, publish_interval, publish_offset, offset_probe, last_fetch_time, late_count, failure_count
+
+    if not succeeded:
+        failure_count += 1
+        next_fetch_time = fetched_time + min(FAILURE_RETRY_IN_SECONDS << min(failure_count - 1, 8), MAX_FAILURE_RETRY_IN_SECONDS)
+        dprint(f"Fetch failed {failure_count} times, retry in {next_fetch_time - fetched_time}s")
+        return
+    failure_count = 0
+
+    update_epoch = parse_update_time(update_time) if update_time else feed_update_epoch
+    if update_time and update_epoch is None:
+        # Unknown updateTime format, fall back to polling
+        next_fetch_time = fetched_time + FETCH_INTERVAL_IN_SECONDS
+        last_fetch_time = fetched_time
+        return
+
+    if update_epoch is not None and update_epoch != feed_update_epoch:
+        # Whether the previous fetch was the scheduled one, i.e. no publication could have been missed in between
+        consecutive = (
+            feed_update_epoch is not None
+            and last_fetch_time is not None
+            and 0 < update_epoch - feed_update_epoch
+            and fetched_time - last_fetch_time <= update_epoch - feed_update_epoch + POLL_GRACE_IN_SECONDS
+        )
+        if consecutive:
+            publish_interval = max(MIN_PUBLISH_INTERVAL_IN_SECONDS, min(update_epoch - feed_update_epoch, MAX_PUBLISH_INTERVAL_IN_SECONDS))
+
+        # Includes the delay of publishing and any difference between the time zones of the feed and the device
+        offset = fetched_time - update_epoch
+        if publish_offset is None or offset < publish_offset:
+            publish_offset = offset
+        elif late_count > 0:
+            # Published between the previous fetch and this one
+            publish_offset = offset
+            offset_probe = 0
+        elif consecutive and offset_probe:
+            # Caught on first try, so try earlier next time until a publication is missed
+            publish_offset -= offset_probe
+            offset_probe = min(offset_probe * 2, publish_interval // 4)
+
+        feed_update_epoch = update_epoch
+        late_count = 0
+
+    last_fetch_time = fetched_time
+
+    if feed_update_epoch is None:
+        next_fetch_time = fetched_time + FETCH_INTERVAL_IN_SECONDS
+        return
+
+    expected_time = feed_update_epoch + publish_interval + publish_offset + POLL_GRACE_IN_SECONDS
+    if expected_time > fetched_time:
+        next_fetch_time = expected_time
+    else:
+        # The next publication is late, keep checking for it
+        late_count += 1
+        next_fetch_time = fetched_time + min(LATE_RETRY_IN_SECONDS << min(late_count - 1, 8), FETCH_INTERVAL_IN_SECONDS)
+
+    dprint(f"Next fetch in {next_fetch_time - fetched_time}s, publish interval {publish_interval}s, offset {publish_offset}s")
+
+def save_snapshot(wait_times: list, fetched_time: int, update_time: str) -> None:
+    """
+    Store the last successful response on flash, one hospital per line, so the
+    next start can display it right away.
+
+    Args:
+        wait_times (list): List of (hospName, topWait) tuples
+        fetched_time (int): When the data was fetched, as returned by clocktime.now()
+        update_time (str): The updateTime of the feed
+    """
+    try:
+        with open(SNAPSHOT_PATH, "w") as file:
+            file.write(f"{fetched_time}\t{clean_snapshot_field(update_time or '')}\n")
+            for hospital_name, top_wait in wait_times:
+                file.write(f"{clean_snapshot_field(hospital_name)}\t{clean_snapshot_field(top_wait)}\n")
+    except OSError as e:
+        dprint(f"Failed to save snapshot: {e}")
+
+def clean_snapshot_field(value: str) -> str:
+    return value.replace("\t", " ").replace("\n", " ")
+
+def load_snapshot():
+    """
+    Load the last successful response stored on flash.
+
+    Returns:
+        Tuple of list of (hospName, topWait) tuples, the time it was fetched and
+        the updateTime of the feed, or None if there is no valid snapshot.
+    """
+    try:
+        with open(SNAPSHOT_PATH, "r") as file:
+            fetched_time, update_time = file.readline().rstrip("\n").split("\t")
+            wait_times = []
+            for line in file:
+                hospital_name, top_wait = line.rstrip("\n").split("\t")
+                wait_times.append((hospital_name, top_wait))
+        return wait_times, int(fetched_time), update_time
+    except (OSError, ValueError) as e:
+        dprint(f"No snapshot loaded: {e}")
+        return None
+
+def refresh_worker() -> None:
+    """
+    Background worker fetching the waiting time whenever a refresh is requested,
+    so the foreground never blocks on the network.
+    """
+    global refresh_requested, refreshing, worker_alive
+
+    saved_wait_times = None
+    validators = None
+
+    try:
+        while not worker_stop:
+            if not refresh_requested:
+                time.sleep_ms(WORKER_POLL_INTERVAL_IN_MS)
+                continue
+
+            refresh_requested = False
+            refreshing = True
+            try:
+                wait_times, update_time, validators = fetch_wait_time(validators)
+                fetched_time = clocktime.now()
+                # Only write the snapshot to flash if something changed
+                if wait_times is not None and wait_times != saved_wait_times:
+                    save_snapshot(wait_times, fetched_time, update_time)
+                    saved_wait_times = wait_times
+                if saved_wait_times is not None:
+                    wait_history.record(saved_wait_times, fetched_time)
+                    wait_history.save()
+                result = (True, (wait_times, fetched_time, update_time, wait_history.samples()))
+            except Exception as e:
+                result = (False, str(e))
+
+            with refresh_lock:
+                refresh_results.append(result)
+            refreshing = False
+    finally:
+        worker_alive = False
+    dprint("Refresh worker ended")
+
+def request_refresh() -> None:
+    """
+    Ask the background worker to fetch latest waiting time, starting the worker if needed
+    """
+    global refresh_requested, worker_alive, worker_stop
+
+    worker_stop = False
+    refresh_requested = True
+    if not worker_alive:
+        worker_alive = True
+        _thread.start_new_thread(refresh_worker, ())
+
+def apply_refresh_results() -> None:
+    """
+    Apply the results handed over by the background worker to the widgets.
+    Only the latest result is applied, if several are ready.
+
+    Returns:
+        None. The main screen is displayed with updated waiting time, or an error if there is no data to show.
+    """
+    global refresh_results
+
+    with refresh_lock:
+        if not refresh_results:
+            return
+        succeeded, result = refresh_results[-1]
+        refresh_results = []
+
+    if succeeded:
+        wait_times, fetched_time, update_time, histories = result
+        schedule_next_fetch(True, update_time, fetched_time)
+        if wait_times is None:
+            # Not modified, the displayed data is still up to date
+            wait_times = feed_wait_times or []
+        display_wait_time(wait_times, fetched_time, histories)
+        return
+
+    schedule_next_fetch(False, None, clocktime.now())
+    if data_fetched_time is None:
+        display_error_screen(f"Error occured while fetching: {result}")
+    else:
+        dprint(f"Refresh failed, keep showing previous data: {result}")
+
+def display_wait_time(wait_times: list, fetched_time: int, histories: dict = None) -> None:
     """
     Display latest waiting time on screen
 
+    Args:
+        wait_times (list): List of (hospName, topWait) tuples
+        fetched_time (int): When the data was fetched, as returned by clocktime.now()
+        histories (dict): Optional samples by hospName to draw as sparkline, as returned by WaitHistory.samples()
+
     Returns:
         None. The main screen is displayed on the screen with updated waiting time.
     """
-    global main_scr, list_container, time_label_map, hospital_count
+    global data_fetched_time, feed_wait_times, view_orders
     dprint("Update screen")
 
     if not main_scr:
-        main_scr = lv.obj()
-
-        # Add header
-        header = lv.label(main_scr)
-        header.set_text("急症室等候時間")
-        header.align(lv.ALIGN.TOP_LEFT, 0, 0)
-        header.set_style_text_align(lv.TEXT_ALIGN.CENTER, 0)
-        header.add_style(header_style, 0)
-        header.update_layout()
-
-        container_height = SCREEN_HEIGHT - header.get_height()
-
-        # Add list container
-        list_container = lv.list(main_scr)
-        list_container.set_size(SCREEN_WIDTH, container_height)
-        list_container.align(lv.ALIGN.TOP_LEFT, 0, header.get_height())
-        list_container.set_scrollbar_mode(lv.SCROLLBAR_MODE.AUTO)
-        list_container.add_style(list_style, 0)
-
-        # Bind input events
-        main_scr.add_event(event_handler, lv.EVENT.ALL, None)
-        lv.group_get_default().add_obj(main_scr)
-        lv.group_focus_obj(main_scr)
-        lv.group_get_default().set_editing(True)
-
-    response = request(API_URL)
-
-    if not time_label_map:
-        time_label_map = {}
-
-        for wait_info in response["waitTime"]:
-            item = lv.obj(list_container)
-            item.add_style(item_style, 0)
-            item.add_style(focused_item_style, lv.STATE.FOCUSED)
-            item.set_height(50)
-
-            name_label = lv.label(item)
-            name_label.set_text(wait_info["hospName"])
-            name_label.set_long_mode(lv.label.LONG.SCROLL_CIRCULAR)
-            name_label.set_width(150)
-            name_label.align(lv.ALIGN.LEFT_MID, 0, 0)
-
-            time_label = lv.label(item)
-            time_label.set_text(wait_info["topWait"])
-            time_label.set_long_mode(lv.label.LONG.SCROLL_CIRCULAR)
-            time_label.set_width(110)
-            time_label.align(lv.ALIGN.RIGHT_MID, 0, 0)
-            time_label.set_style_text_align(lv.TEXT_ALIGN.RIGHT, 0)
-
-            time_label_map[wait_info["hospName"]] = time_label
-            hospital_count = hospital_count + 1
-    else:
-        for wait_info in response["waitTime"]:
-            time_label_map[wait_info["hospName"]].set_text(wait_info["topWait"])
+        create_main_screen()
+
+    feed_wait_times = wait_times
+    view_orders = compute_view_orders(wait_times)
+    view_wait_times, visible_count = view_orders[current_view]
+    changed_count = render_wait_times(view_wait_times, histories, visible_count)
+    data_fetched_time = fetched_time
+    dprint(f"{changed_count} of {hospital_count} rows changed")
+
+    update_status_label()
 
     if main_scr and not main_scr.is_visible():
         lv.scr_load(main_scr)
+    elif changed_count == 0:
+        return
 
     lv.refr_now(None)
 
+def update_status_label() -> None:
+    """
+    Show the title of the view shortly after switching views, whether a refresh
+    is running, or else how old the displayed data is. The label is only touched
+    when its text changes.
+    """
+    global last_status_text, view_title_until
+
+    if not status_label:
+        return
+
+    if view_title_until is not None and time.ticks_diff(view_title_until, time.ticks_ms()) <= 0:
+        view_title_until = None
+
+    if view_title_until is not None:
+        status_text = [title for title, view in VIEWS if view == current_view][0]
+    elif refreshing or refresh_requested:
+        status_text = "Updating..."
+    elif data_fetched_time is None:
+        status_text = ""
+    else:
+        age_in_minutes = max(0, clocktime.now() - data_fetched_time) // 60
+        if age_in_minutes == 0:
+            status_text = "Just now"
+        elif age_in_minutes < 60:
+            status_text = f"{age_in_minutes} min ago"
+        else:
+            status_text = f"{age_in_minutes // 60} h ago"
+
+    if status_text != last_status_text:
+        status_label.set_text(status_text)
+        last_status_text = status_text
+
+class HospitalRow:
+    """
+    The widgets of a hospital in the list, together with the values they show
+    """
+    __slots__ = ("item", "name_label", "time_label", "sparkline", "points", "hospital_name", "top_wait", "history", "visible")
+
+    def __init__(self, hospital_name: str, top_wait: str) -> None:
+        self.item = lv.obj(list_container)
+        self.item.add_style(item_style, 0)
+        self.item.add_style(focused_item_style, lv.STATE.FOCUSED)
+        self.item.set_height(50)
+
+        self.name_label = lv.label(self.item)
+        self.name_label.set_text(hospital_name)
+        self.name_label.set_long_mode(lv.label.LONG.SCROLL_CIRCULAR)
+        self.name_label.set_width(150)
+        self.name_label.align(lv.ALIGN.LEFT_MID, 0, 0)
+
+        self.time_label = lv.label(self.item)
+        self.time_label.set_text(top_wait)
+        self.time_label.set_long_mode(lv.label.LONG.SCROLL_CIRCULAR)
+        self.time_label.set_width(110)
+        self.time_label.align(lv.ALIGN.RIGHT_MID, 0, 0)
+        self.time_label.set_style_text_align(lv.TEXT_ALIGN.RIGHT, 0)
+
+        # Between the name and the waiting time
+        self.sparkline = lv.line(self.item)
+        self.sparkline.add_style(sparkline_style, 0)
+        self.sparkline.set_size(SPARKLINE_WIDTH, SPARKLINE_HEIGHT)
+        self.sparkline.align(lv.ALIGN.LEFT_MID, 154, 0)
+        self.sparkline.add_flag(lv.obj.FLAG.HIDDEN)
+        self.points = None  # Referenced by the line, so it must be kept alive
+
+        self.hospital_name = hospital_name
+        self.top_wait = top_wait
+        self.history = None
+        self.visible = True
+
+    def rebind(self, hospital_name: str) -> None:
+        """
+        Reuse the widgets of a removed hospital for another one
+        """
+        self.name_label.set_text(hospital_name)
+        self.item.remove_state(lv.STATE.FOCUSED)
+        self.hospital_name = hospital_name
+        self.top_wait = None
+        self.set_history(None)
+
+    def set_wait(self, top_wait: str) -> bool:
+        """
+        Update the waiting time, only touching the label if the text changed
+
+        Returns:
+            True, if the text changed.
+        """
+        if top_wait == self.top_wait:
+            return False
+        self.time_label.set_text(top_wait)
+        self.top_wait = top_wait
+        return True
+
+    def set_visible(self, visible: bool) -> bool:
+        """
+        Show or hide the row, e.g. if it is filtered out by the current view
+
+        Returns:
+            True, if the visibility changed.
+        """
+        if visible == self.visible:
+            return False
+        if visible:
+            self.item.remove_flag(lv.obj.FLAG.HIDDEN)
+        else:
+            self.item.add_flag(lv.obj.FLAG.HIDDEN)
+            self.item.remove_state(lv.STATE.FOCUSED)
+        self.visible = visible
+        return True
+
+    def set_history(self, samples) -> bool:
+        """
+        Draw the history of waiting time as sparkline, if it changed. Buckets
+        without sample are skipped.
+
+        Args:
+            samples (bytes): Samples from oldest to latest bucket as returned by WaitHistory.samples(), or None
+
+        Returns:
+            True, if the sparkline changed.
+        """
+        if samples == self.history:
+            return False
+        self.history = samples
+
+        values = [(index, value) for index, value in enumerate(samples or ()) if value != NO_SAMPLE]
+        if len(values) < 2:
+            self.sparkline.add_flag(lv.obj.FLAG.HIDDEN)
+            return True
+
+        scale = max(max(value for _, value in values), SPARKLINE_MIN_SCALE_IN_MINUTES // WAIT_UNIT_IN_MINUTES)
+        self.points = [
+            lv.point_precise_t({
+                "x": index * (SPARKLINE_WIDTH - 1) // (HISTORY_LENGTH - 1),
+                "y": (SPARKLINE_HEIGHT - 1) - value * (SPARKLINE_HEIGHT - 1) // scale,
+            })
+            for index, value in values
+        ]
+        self.sparkline.set_points(self.points, len(self.points))
+        self.sparkline.remove_flag(lv.obj.FLAG.HIDDEN)
+        return True
+
+def render_wait_times(wait_times, histories: dict = None, visible_count: int = None) -> int:
+    """
+    Reconcile the rows of the list with latest waiting times by hospName.
+    Rows are only created, removed or moved for hospitals that were added,
+    removed or reordered in the feed. Widgets of removed hospitals are reused
+    for added ones.
+
+    Args:
+        wait_times: Iterable of (hospName, topWait) tuples
+        histories (dict): Optional samples by hospName to draw as sparkline, as returned by WaitHistory.samples()
+        visible_count (int): Optional number of rows to show, the remaining rows are hidden
+
+    Returns:
+        The number of rows which were changed.
+    """
+    global hospital_rows, hospital_order, hospital_count, previous_focus_index
+
+    if hospital_rows is None:
+        hospital_rows = {}
+        hospital_order = []
+
+    focused_name = hospital_order[previous_focus_index] if 0 <= previous_focus_index < len(hospital_order) else None
+
+    wait_times = list(wait_times)
+    new_names = set(hospital_name for hospital_name, _ in wait_times)
+    unused_rows = [hospital_rows.pop(hospital_name) for hospital_name in hospital_order if hospital_name not in new_names]
+
+    changed_count = 0
+    new_order = []
+    for hospital_name, top_wait in wait_times:
+        if hospital_name in new_order:
+            # A duplicated hospital name is shown once
+            continue
+        if hospital_name in hospital_rows:
+            row = hospital_rows[hospital_name]
+            changed = row.set_wait(top_wait)
+        elif unused_rows:
+            row = unused_rows.pop()
+            row.rebind(hospital_name)
+            row.set_wait(top_wait)
+            changed = True
+        else:
+            row = HospitalRow(hospital_name, top_wait)
+            changed = True
+
+        if histories is not None and row.set_history(histories.get(hospital_name)):
+            changed = True
+
+        hospital_rows[hospital_name] = row
+        index = len(new_order)
+        if row.item.get_index() != index:
+            row.item.move_to_index(index)
+            changed = True
+        if row.set_visible(visible_count is None or index < visible_count):
+            changed = True
+        new_order.append(hospital_name)
+        if changed:
+            changed_count = changed_count + 1
+
+    for row in unused_rows:
+        row.item.delete()
+        changed_count = changed_count + 1
+
+    hospital_order = new_order
+    hospital_count = len(new_order) if visible_count is None else min(visible_count, len(new_order))
+    previous_focus_index = new_order.index(focused_name) if focused_name in hospital_rows else -1
+    if previous_focus_index >= hospital_count:
+        previous_focus_index = -1
+
+    return changed_count
+
 # ---------- Lifecycle hooks ----------
+async def on_boot(apm):
+    """
+    Code executed on boot.
+
+    See https://dock.myvobot.com/developer/guides/app-design/ for clife cycle diagram
+    """
+    global app_mgr
+    app_mgr = apm
+
 async def on_start():
     """
     Code executed on start.
 
     See https://dock.myvobot.com/developer/guides/app-design/ for clife cycle diagram
     """
-    global last_api_call_time
+    global last_api_call_time, next_fetch_time, wait_history, current_view
     dprint("on start")
 
-    display_info_screen("Loading...")
+    app_mgr_config = app_mgr.config() if app_mgr else {}
+    current_view = app_mgr_config.get("view", VIEW_FEED)
+    if current_view not in [view for _, view in VIEWS] or (current_view == VIEW_FAVOURITES and not get_favourites()):
+        current_view = VIEW_FEED
 
-    # Initial fetch and display
-    try:
-        last_api_call_time = clocktime.now()
-        fetch_and_display_wait_time()
-    except Exception as e:
-        display_error_screen(f"Error occured on start: {e}")
+    # Recorded by the background worker from now on
+    wait_history = WaitHistory()
+    wait_history.load()
+
+    # Show the last known waiting time right away, while the live data is fetched in background
+    snapshot = load_snapshot()
+    if snapshot:
+        wait_times, fetched_time, _ = snapshot
+        display_wait_time(wait_times, fetched_time, wait_history.samples())
+    else:
+        display_info_screen("Loading...")
+
+    last_api_call_time = clocktime.now()
+    # Rescheduled once the result arrives
+    next_fetch_time = last_api_call_time + FETCH_INTERVAL_IN_SECONDS
+    request_refresh()
 
 async def on_running_foreground():
     """
@@ -295,14 +1233,18 @@ async def on_running_foreground():
 
     See https://dock.myvobot.com/developer/guides/app-design/ for clife cycle diagram
     """
-    global last_api_call_time
+    global last_api_call_time, next_fetch_time
     current_time: int = clocktime.now()
 
     try:
-        # Re-fetch latest data according to fetch interval settings
-        if current_time - last_api_call_time >= FETCH_INTERVAL_IN_SECONDS or current_time - last_api_call_time < 0:
-            last_api_call_time = clocktime.now()
-            fetch_and_display_wait_time()
+        # Re-fetch latest data when scheduled, or if the clock went back
+        if not (refresh_requested or refreshing) and (current_time >= next_fetch_time or current_time < last_api_call_time):
+            last_api_call_time = current_time
+            next_fetch_time = current_time + FETCH_INTERVAL_IN_SECONDS
+            request_refresh()
+
+        apply_refresh_results()
+        update_status_label()
     except Exception as e:
         display_error_screen(f"Error occured on running foreground: {e}")
 
@@ -312,9 +1254,18 @@ async def on_stop():
 
     See https://dock.myvobot.com/developer/guides/app-design/ for clife cycle diagram
     """
-    global main_scr, message_scr, time_label_map, list_container, last_api_call_time, hospital_count, previous_focus_index
+    global main_scr, message_scr, status_label, hospital_rows, hospital_order, list_container, last_api_call_time, hospital_count, previous_focus_index
+    global data_fetched_time, last_status_text, refresh_results, refresh_requested, worker_stop
+    global feed_wait_times, view_orders, view_title_until
+    global next_fetch_time, feed_update_epoch, publish_interval, publish_offset, offset_probe, last_fetch_time, late_count, failure_count
     dprint("on stop")
 
+    # The worker finishes a fetch in flight on its own, its result is discarded
+    worker_stop = True
+    refresh_requested = False
+    with refresh_lock:
+        refresh_results = []
+
     if main_scr:
         main_scr.clean()
         main_scr.del_async()
@@ -327,7 +1278,51 @@ async def on_stop():
 
     # Reset states since they seems to be preserved when pressing back (ESC) button
     list_container = None
-    time_label_map = None
+    status_label = None
+    hospital_rows = None
+    hospital_order = None
     last_api_call_time = 0
     hospital_count = 0
     previous_focus_index = -1
+    data_fetched_time = None
+    last_status_text = None
+    feed_wait_times = None
+    view_orders = None
+    view_title_until = None
+    next_fetch_time = 0
+    feed_update_epoch = None
+    publish_interval = PUBLISH_INTERVAL_IN_SECONDS
+    publish_offset = None
+    offset_probe = OFFSET_PROBE_IN_SECONDS
+    last_fetch_time = None
+    late_count = 0
+    failure_count = 0
+
+def get_settings_json() -> dict:
+    """
+    App settings.
+
+    The app is configured via the webbrowser. This json helps creating the app settings page.
+    See https://dock.myvobot.com/developer/reference/web-page/ for reference
+    """
+    return {
+        "title": "Settings for A&E Waiting Time app",
+        "form": [
+            {
+                "type": "select",
+                "default": VIEW_FEED,
+                "caption": "View on start",
+                "name": "view",
+                "options": VIEWS,
+                "tip": "Press the knob to switch between the views.",
+            },
+            {
+                "type": "input",
+                "default": "",
+                "caption": "Favourite hospitals",
+                "name": "favourites",
+                "tip": "Comma separated parts of the hospital names, e.g. 瑪麗, 屯門. Only these hospitals are shown in the favourites view.",
+                "attributes": {"placeholder": "瑪麗, 屯門"},
+            },
+        ],
+    }
@@ -12,6 +12,8 @@ NAME = "HK Public Holidays"
 CAN_BE_AUTO_SWITCHED: bool = True
 DEBUG: bool = False
 API_URL: str = "https://www.1823.gov.hk/common/ical/tc.json"
+CACHE_PATH: str = "./apps/public-holidays/calendar.txt"
+REVALIDATE_INTERVAL_IN_DAYS: int = 7
 
 # ---------- App Icon ----------
 ICON: str = "A:apps/public-holidays/resources/icon.png"
@@ -24,6 +26,8 @@ MESSAGE_TYPE: dict[str, int] = {
     "WARN": 2,
     "ERROR": 3,
 }
+VISIBLE_ROWS: int = 3
+ROW_POOL_SIZE: int = VISIBLE_ROWS + 1  # One buffer row below the visible rows
 
 # ---------- LVGL Widget ----------
 font_chinese = lv.binfont_create("A:apps/public-holidays/fonts/NotoSansTC_20_bpp2.bin")
@@ -31,6 +35,7 @@ font_chinese = lv.binfont_create("A:apps/public-holidays/fonts/NotoSansTC_20_bpp
 # Main screen
 main_scr = None
 list_container = None
+holiday_rows = None  # Pool of HolidayRow, in the order they are displayed
 
 # Message screen
 message_scr = None
@@ -39,6 +44,13 @@ message_scr = None
 last_api_call_date = 0
 holiday_count = 0
 previous_focus_index = -1
+holidays = []  # (date in YYYYMMDD format, summary) tuples of future events
+calendar_events = None  # (date in YYYYMMDD format, summary) tuples from the day the calendar was fetched
+calendar_fetched_date = 0
+calendar_validators = {}  # If-None-Match / If-Modified-Since headers to revalidate the calendar
+last_revalidation_date = 0
+displayed_date = 0  # Date the countdowns are calculated for
+window_start = 0  # Index of the holiday shown in the first row
 
 # ---------- Styles ----------
 def reset_style(style_object):
@@ -115,14 +127,16 @@ def dprint(msg: str) -> None:
     if DEBUG:
         print(msg)
 
-def request(url: str):
+def request(url: str, validators: dict = None):
     """
     Load JSON response from a given URL.
 
     Args:
         url (str): The URL to load
+        validators (dict): Optional If-None-Match / If-Modified-Since headers of a conditional request
     Returns:
-        JSON object.
+        Tuple of JSON object, or None if the validators still match, and the
+        validators of the response.
 
     Raises:
         Exception, if something went wrong loading the API.
@@ -130,18 +144,45 @@ def request(url: str):
     if net.connected():
         dprint(f"Fetching {url}")
 
-        response = urequests.get(url, headers={"Content-Type": "application/json"})
+        headers = {"Content-Type": "application/json"}
+        if validators:
+            headers.update(validators)
+        response = urequests.get(url, headers=headers)
 
-        if response.status_code == 200:
+        if response.status_code == 304:
+            dprint("Not modified")
+            response.close()
+            return None, validators
+        elif response.status_code == 200:
             dprint(f"Got response with status code {response.status_code}")
             # API response from 1823.gov.hk returns BOM character at the beginning of file
             # which we have to remove it to parse the JSON properly
-            return ujson.loads(response.text[1:] if response.text.startswith("\ufeff") else response.text)
+            return ujson.loads(response.text[1:] if response.text.startswith("\ufeff") else response.text), get_validators(response)
         else:
             raise Exception(f"Failed to load {url}, status code: {response.status_code}, response body: {response.text}")
     else:
         raise Exception(f"Wifi is not connected")
 
+def get_validators(response) -> dict:
+    """
+    Build the headers of a conditional request from the ETag and Last-Modified
+    headers of a response.
+
+    Args:
+        response: The response to read the headers from
+
+    Returns:
+        Dict of If-None-Match / If-Modified-Since headers, empty if the server sent no validators.
+    """
+    validators = {}
+    for name, value in (getattr(response, "headers", None) or {}).items():
+        name = name.lower()
+        if name == "etag":
+            validators["If-None-Match"] = value
+        elif name == "last-modified":
+            validators["If-Modified-Since"] = value
+    return validators
+
 def make_display_fullscreen_message(level: str = MESSAGE_TYPE["INFO"]) -> function[str]:
     """
     Creates function that display fullscreen message
@@ -205,28 +246,22 @@ def event_handler(event) -> None:
 
 def focus_item(index: int) -> None:
     """
-    Focus list item of given index
+    Focus list item of given index, scrolling the rows if needed
 
     Args:
-        index (int): The index of the list item to focus
+        index (int): The index of the holiday to focus
 
     Returns:
         None. The list item is focused.
     """
-    global list_container, previous_focus_index
-    current_item = list_container.get_child(index)
-
-    if previous_focus_index != -1:
-        previous_item = list_container.get_child(previous_focus_index)
-        if previous_item:
-            previous_item.remove_state(lv.STATE.FOCUSED)
-
-    if current_item:
-        current_item.add_state(lv.STATE.FOCUSED)
-        current_item.scroll_to_view(lv.ANIM.OFF)
+    global previous_focus_index
 
+    scroll_to_holiday(index)
     previous_focus_index = index
 
+    for row in holiday_rows:
+        row.set_focused(row.index == index)
+
 def get_current_date() -> int:
     """
     Get and return current date as YYYYMMDD format
@@ -248,14 +283,119 @@ def days_between(date1: int, date2: int):
     datetime2 = (date2 // 10000, date2 % 10000 // 100, date2 % 100) + time_info
     return abs(utime.mktime(datetime1) // (24 * 3600) - utime.mktime(datetime2) // (24 * 3600))
 
-def fetch_and_display_public_holiday(current_date: int) -> None:
+class HolidayRow:
     """
-    Display future public holiday on screen
+    A row of the list, which is rebound to different holidays while scrolling
+    instead of creating widgets for every holiday.
+    """
+    __slots__ = ("item", "name_label", "date_label", "countdown_chip", "index", "focused")
+
+    def __init__(self, height: int) -> None:
+        self.item = lv.obj(list_container)
+        self.item.add_style(item_style, 0)
+        self.item.add_style(focused_item_style, lv.STATE.FOCUSED)
+        self.item.set_size(SCREEN_WIDTH, height)
+
+        left_content = lv.obj(self.item)
+        left_content.add_style(container_style, 0)
+        left_content.align(lv.ALIGN.LEFT_MID, 0, 0)
+        left_content.set_size(140, height - 12)
+
+        self.name_label = lv.label(left_content)
+        self.name_label.set_long_mode(lv.label.LONG.SCROLL_CIRCULAR)
+        self.name_label.set_style_pad_ver(5, 0)
+        self.name_label.set_width(140)
+        self.name_label.align(lv.ALIGN.TOP_LEFT, 0, 0)
+
+        self.date_label = lv.label(left_content)
+        self.date_label.add_style(remarks_style, 0)
+        self.date_label.set_long_mode(lv.label.LONG.SCROLL_CIRCULAR)
+        self.date_label.set_width(140)
+        self.date_label.align(lv.ALIGN.BOTTOM_LEFT, 0, 0)
+
+        self.countdown_chip = lv.label(self.item)
+        self.countdown_chip.add_style(chip_style, 0)
+        self.countdown_chip.set_long_mode(lv.label.LONG.SCROLL_CIRCULAR)
+        self.countdown_chip.set_width(140)
+        self.countdown_chip.align(lv.ALIGN.RIGHT_MID, 0, 0)
+
+        self.index = -1
+        self.focused = False
+
+    def bind(self, index: int) -> None:
+        """
+        Show the holiday of given index, or hide the row if there is none
+
+        Args:
+            index (int): The index of the holiday in `holidays`
+        """
+        self.index = index
+        if not 0 <= index < len(holidays):
+            self.item.add_flag(lv.obj.FLAG.HIDDEN)
+            self.set_focused(False)
+            return
+
+        holiday_date, summary = holidays[index]
+        self.name_label.set_text(summary)
+        date_str = str(holiday_date)
+        self.date_label.set_text(f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}")
+
+        countdown = days_between(displayed_date, holiday_date)
+        self.countdown_chip.set_text(f"還有 {countdown} 天" if countdown > 0 else "今天")
+        self.countdown_chip.set_style_bg_color(lv.color_hex(0x4C89B2) if countdown > 0 else lv.color_hex(0xE25E55), 0)
+
+        self.item.remove_flag(lv.obj.FLAG.HIDDEN)
+        self.set_focused(index == previous_focus_index)
+
+    def set_focused(self, focused: bool) -> None:
+        if focused == self.focused:
+            return
+        if focused:
+            self.item.add_state(lv.STATE.FOCUSED)
+        else:
+            self.item.remove_state(lv.STATE.FOCUSED)
+        self.focused = focused
+
+def scroll_to_holiday(index: int) -> None:
+    """
+    Move the window of rows so the holiday of given index is visible. Scrolling
+    by one recycles a single row from one end of the pool to the other, so only
+    that row is rebound. Jumping further rebinds all rows.
+
+    Args:
+        index (int): The index of the holiday to show
+    """
+    global window_start
+
+    if window_start <= index < window_start + VISIBLE_ROWS:
+        return
+
+    new_start = index if index < window_start else index - VISIBLE_ROWS + 1
+    if new_start == window_start + 1:
+        # The first row becomes the buffer row below the visible rows
+        row = holiday_rows.pop(0)
+        holiday_rows.append(row)
+        row.item.move_to_index(ROW_POOL_SIZE - 1)
+        row.bind(new_start + ROW_POOL_SIZE - 1)
+    elif new_start == window_start - 1:
+        # The buffer row becomes the first row
+        row = holiday_rows.pop()
+        holiday_rows.insert(0, row)
+        row.item.move_to_index(0)
+        row.bind(new_start)
+    else:
+        for offset, row in enumerate(holiday_rows):
+            row.bind(new_start + offset)
+    window_start = new_start
+
+def display_public_holidays() -> None:
+    """
+    Display `holidays` on screen, creating the main screen and the pool of rows on first call
 
     Returns:
         None. The main screen is displayed on the screen with updated public holidays.
     """
-    global main_scr, list_container, holiday_count
+    global main_scr, list_container, holiday_rows, holiday_count, previous_focus_index, window_start
     dprint("Update screen")
 
     if not main_scr:
@@ -271,68 +411,134 @@ def fetch_and_display_public_holiday(current_date: int) -> None:
 
         container_height = SCREEN_HEIGHT - header.get_height()
 
-        # Add list container
+        # Add list container. It is not scrolled, as the rows are rebound instead.
         list_container = lv.list(main_scr)
         list_container.set_size(SCREEN_WIDTH, container_height)
         list_container.align(lv.ALIGN.TOP_LEFT, 0, header.get_height())
-        list_container.set_scrollbar_mode(lv.SCROLLBAR_MODE.AUTO)
+        list_container.set_scrollbar_mode(lv.SCROLLBAR_MODE.OFF)
+        list_container.remove_flag(lv.obj.FLAG.SCROLLABLE)
         list_container.add_style(list_style, 0)
         list_container.update_layout()
 
+        holiday_rows = [HolidayRow(list_container.get_height() // VISIBLE_ROWS) for _ in range(ROW_POOL_SIZE)]
+
         # Bind input events
         main_scr.add_event(event_handler, lv.EVENT.ALL, None)
         lv.group_get_default().add_obj(main_scr)
         lv.group_focus_obj(main_scr)
         lv.group_get_default().set_editing(True)
 
-    response = request(API_URL)
+    holiday_count = len(holidays)
+    if previous_focus_index >= holiday_count:
+        previous_focus_index = -1
+    window_start = max(0, min(window_start, holiday_count - VISIBLE_ROWS))
+    for offset, row in enumerate(holiday_rows):
+        row.bind(window_start + offset)
+
+    if main_scr and not main_scr.is_visible():
+        lv.scr_load(main_scr)
+
+    lv.refr_now(None)
+
+def save_calendar_cache() -> None:
+    """
+    Store the calendar on flash: a header line with the date it was fetched and
+    its validators, followed by one event per line.
+    """
+    try:
+        with open(CACHE_PATH, "w") as file:
+            etag = clean_cache_field(calendar_validators.get("If-None-Match", ""))
+            last_modified = clean_cache_field(calendar_validators.get("If-Modified-Since", ""))
+            file.write(f"{calendar_fetched_date}\t{etag}\t{last_modified}\n")
+            for holiday_date, summary in calendar_events:
+                file.write(f"{holiday_date}\t{clean_cache_field(summary)}\n")
+    except OSError as e:
+        dprint(f"Failed to save calendar: {e}")
+
+def clean_cache_field(value: str) -> str:
+    return value.replace("\t", " ").replace("\n", " ")
+
+def load_calendar_cache() -> bool:
+    """
+    Load the calendar stored on flash.
+
+    Returns:
+        True, if a valid calendar was loaded.
+    """
+    global calendar_events, calendar_fetched_date, calendar_validators
 
-    list_container.clean()
+    try:
+        with open(CACHE_PATH, "r") as file:
+            fetched_date, etag, last_modified = file.readline().rstrip("\n").split("\t")
+            events = []
+            for line in file:
+                holiday_date, summary = line.rstrip("\n").split("\t")
+                events.append((int(holiday_date), summary))
+    except (OSError, ValueError) as e:
+        dprint(f"No calendar loaded: {e}")
+        return False
+
+    calendar_events = events
+    calendar_fetched_date = int(fetched_date)
+    calendar_validators = {}
+    if etag:
+        calendar_validators["If-None-Match"] = etag
+    if last_modified:
+        calendar_validators["If-Modified-Since"] = last_modified
+    return True
+
+def needs_revalidation(current_date: int) -> bool:
+    """
+    Whether the calendar should be fetched again, i.e. if there is none, it is
+    older than REVALIDATE_INTERVAL_IN_DAYS, or it has no future events left.
 
-    future_events = [event for event in response["vcalendar"][0]["vevent"] if int(event["dtstart"][0]) >= current_date]
+    Args:
+        current_date (int): Current date in YYYYMMDD format
+    """
+    return (
+        calendar_events is None
+        or days_between(calendar_fetched_date, current_date) >= REVALIDATE_INTERVAL_IN_DAYS
+        or not any(holiday_date >= current_date for holiday_date, _ in calendar_events)
+    )
 
-    for event in future_events:
-        item = lv.obj(list_container)
-        item.add_style(item_style, 0)
-        item.add_style(focused_item_style, lv.STATE.FOCUSED)
-        item.set_size(SCREEN_WIDTH, list_container.get_height() // 3)
+def show_holidays(current_date: int) -> None:
+    """
+    Display the future events of the calendar, with countdowns from the given date
 
-        left_content = lv.obj(item)
-        left_content.add_style(container_style, 0)
-        left_content.align(lv.ALIGN.LEFT_MID, 0, 0)
-        left_content.set_size(140, (list_container.get_height() // 3) - 12);
-
-        name_label = lv.label(left_content)
-        name_label.set_text(event["summary"])
-        name_label.set_long_mode(lv.label.LONG.SCROLL_CIRCULAR)
-        name_label.set_style_pad_ver(5, 0)
-        name_label.set_width(140)
-        name_label.align(lv.ALIGN.TOP_LEFT, 0, 0)
-
-        date_label = lv.label(left_content)
-        date_label.add_style(remarks_style, 0)
-        date_str = event["dtstart"][0]
-        date_label.set_text(f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}")
-        date_label.set_long_mode(lv.label.LONG.SCROLL_CIRCULAR)
-        date_label.set_width(140)
-        date_label.align(lv.ALIGN.BOTTOM_LEFT, 0, 0)
-
-        countdown_chip = lv.label(item)
-        countdown_chip.add_style(chip_style, 0)
-        holiday_date = int(event["dtstart"][0])
-        countdown = days_between(current_date, holiday_date)
-        countdown_chip.set_text(f"還有 {countdown} 天" if countdown > 0 else "今天")
-        countdown_chip.set_style_bg_color(lv.color_hex(0x4C89B2) if countdown > 0 else lv.color_hex(0xE25E55), 0)
-        countdown_chip.set_long_mode(lv.label.LONG.SCROLL_CIRCULAR)
-        countdown_chip.set_width(140)
-        countdown_chip.align(lv.ALIGN.RIGHT_MID, 0, 0)
-
-        holiday_count = len(future_events)
+    Args:
+        current_date (int): Current date in YYYYMMDD format
+    """
+    global holidays, displayed_date
 
-    if main_scr and not main_scr.is_visible():
-        lv.scr_load(main_scr)
+    holidays = [event for event in calendar_events if event[0] >= current_date]
+    displayed_date = current_date
+    display_public_holidays()
 
-    lv.refr_now(None)
+def fetch_and_display_public_holiday(current_date: int) -> None:
+    """
+    Revalidate the calendar, store it on flash if it changed, and display future ones on screen
+
+    Args:
+        current_date (int): Current date in YYYYMMDD format
+
+    Returns:
+        None. The main screen is displayed on the screen with updated public holidays.
+    """
+    global calendar_events, calendar_fetched_date, calendar_validators
+
+    response, validators = request(API_URL, calendar_validators if calendar_events is not None else None)
+
+    if response is not None:
+        calendar_events = [
+            (int(event["dtstart"][0]), event["summary"])
+            for event in response["vcalendar"][0]["vevent"]
+            if int(event["dtstart"][0]) >= current_date
+        ]
+    calendar_fetched_date = current_date
+    calendar_validators = validators or {}
+    save_calendar_cache()
+
+    show_holidays(current_date)
 
 # ---------- Lifecycle hooks ----------
 async def on_start():
@@ -341,15 +547,22 @@ async def on_start():
 
     See https://dock.myvobot.com/developer/guides/app-design/ for clife cycle diagram
     """
-    global last_api_call_date
+    global last_api_call_date, last_revalidation_date
     dprint("on start")
 
+    current_date = get_current_date()
+    last_api_call_date = current_date
+
+    # Show the cached calendar right away, it is revalidated on the next foreground run if needed
+    if load_calendar_cache():
+        show_holidays(current_date)
+        return
+
     display_info_screen("Loading...")
 
     # Initial fetch and display
     try:
-        current_date = get_current_date()
-        last_api_call_date = current_date
+        last_revalidation_date = current_date
         fetch_and_display_public_holiday(current_date)
     except Exception as e:
         display_error_screen(f"Error occured on start: {e}")
@@ -360,16 +573,24 @@ async def on_running_foreground():
 
     See https://dock.myvobot.com/developer/guides/app-design/ for clife cycle diagram
     """
-    global last_api_call_date
+    global last_api_call_date, last_revalidation_date
     current_date: int = get_current_date()
 
     try:
-        # Re-fetch latest data according to fetch interval settings
-        if current_date != last_api_call_date:
+        # Update the countdowns when the date changes
+        if current_date != last_api_call_date and calendar_events is not None:
             last_api_call_date = current_date
+            show_holidays(current_date)
+
+        # Revalidate the calendar at most once a day, when it is outdated
+        if current_date != last_revalidation_date and needs_revalidation(current_date):
+            last_revalidation_date = current_date
             fetch_and_display_public_holiday(current_date)
     except Exception as e:
-        display_error_screen(f"Error occured on running foreground: {e}")
+        if calendar_events is None:
+            display_error_screen(f"Error occured on running foreground: {e}")
+        else:
+            dprint(f"Failed to revalidate calendar, keep showing cached one: {e}")
 
 async def on_stop():
     """
@@ -377,7 +598,8 @@ async def on_stop():
 
     See https://dock.myvobot.com/developer/guides/app-design/ for clife cycle diagram
     """
-    global main_scr, message_scr, list_container, last_api_call_date, holiday_count, previous_focus_index
+    global main_scr, message_scr, list_container, holiday_rows, last_api_call_date, holiday_count, previous_focus_index
+    global holidays, displayed_date, window_start, calendar_events, calendar_fetched_date, calendar_validators, last_revalidation_date
     dprint("on stop")
 
     if main_scr:
@@ -391,8 +613,16 @@ async def on_stop():
         message_scr = None
 
     list_container = None
+    holiday_rows = None
 
     # Reset states since they seems to be preserved when pressing back (ESC) button
     last_api_call_date = 0
     holiday_count = 0
     previous_focus_index = -1
+    holidays = []
+    displayed_date = 0
+    window_start = 0
+    calendar_events = None
+    calendar_fetched_date = 0
+    calendar_validators = {}
+    last_revalidation_date = 0